@@ -8,7 +8,10 @@ from typing import (
     cast, Optional, Tuple, List, Dict, Set, Iterable, Mapping, Any)
 import re
 from collections import defaultdict
+from itertools import chain
 import random
+import sys
+from types import MappingProxyType
 
 from penman.exceptions import ModelError
 from penman.types import (
@@ -26,6 +29,19 @@ _Reified = Tuple[Constant, Role, Role]
 _Dereified = Tuple[Role, Role, Role]
 _Reification = Tuple[BasicTriple, BasicTriple, BasicTriple]
 
+# roles containing any of these characters are treated as regular
+# expressions; all others are matched literally
+_ROLE_METACHARS = re.compile(r'[\\.^$*+?{}\[\]|()]')
+
+# mappings made read-only by Model.freeze()
+_TABLE_ATTRIBUTES = ('roles', 'normalizations',
+                     'reifications', 'dereifications')
+
+# attributes rebuilt after unpickling instead of being pickled
+_CACHE_ATTRIBUTES = ('_role_states',
+                     '_inverted_roles',
+                     '_canonical_roles')
+
 
 class Model(object):
     """
@@ -40,7 +56,22 @@ class Model(object):
         roles: a mapping of roles to associated data
         normalizations: a mapping of roles to normalized roles
         reifications: a list of 4-tuples used to define reifications
+
+    The results of :meth:`invert_role` and :meth:`canonicalize_role`
+    are cached, so a model should not be modified after it is created.
+    Use :meth:`freeze` to make its mappings read-only.
     """
+
+    __slots__ = ('top_variable', 'top_role', 'concept_role',
+                 'roles', 'normalizations',
+                 'reifications', 'dereifications',
+                 '_role_set', '_role_re',
+                 '_frozen',
+                 '_role_states',
+                 '_inverted_roles',
+                 '_canonical_roles',
+                 '__weakref__')
+
     def __init__(self,
                  top_variable: Variable = 'top',
                  top_role: Role = ':TOP',
@@ -49,28 +80,112 @@ class Model(object):
                  normalizations: Mapping[Role, Role] = None,
                  reifications: Iterable[_ReificationSpec] = None):
         self.top_variable = top_variable
-        self.top_role = top_role
-        self.concept_role = concept_role
+        # roles are interned as they are used as keys in every lookup
+        self.top_role = top_role = sys.intern(top_role)
+        self.concept_role = concept_role = sys.intern(concept_role)
 
         if roles:
-            roles = dict(roles)
+            roles = {sys.intern(role): data
+                     for role, data in dict(roles).items()}
         self.roles = roles or {}
-        self._role_re = re.compile(
-            '^({})$'.format(
-                '|'.join(list(self.roles) + [top_role, concept_role])))
+
+        # literal roles are checked by set membership; only roles
+        # defined as patterns (e.g., ":op[0-9]+") need the regex
+        role_set = set()
+        role_patterns = []
+        for role in chain(self.roles, (top_role, concept_role)):
+            if _ROLE_METACHARS.search(role):
+                role_patterns.append(role)
+            else:
+                role_set.add(role)
+        self._role_set = frozenset(role_set)
+        self._role_re = None
+        if role_patterns:
+            self._role_re = re.compile(
+                '^({})$'.format('|'.join(role_patterns)))
 
         if normalizations:
-            normalizations = dict(normalizations)
+            normalizations = {sys.intern(role): sys.intern(normal)
+                              for role, normal
+                              in dict(normalizations).items()}
         self.normalizations = normalizations or {}
 
-        reifs: Dict[Role, List[_Reified]] = defaultdict(list)
-        deifs: Dict[Constant, List[_Dereified]] = defaultdict(list)
+        reifs: Dict[Role, List[_Reified]] = {}
+        deifs: Dict[Constant, List[_Dereified]] = {}
         if reifications:
             for role, concept, source, target in reifications:
-                reifs[role].append((concept, source, target))
-                deifs[concept].append((role, source, target))
-        self.reifications = dict(reifs)
-        self.dereifications = dict(deifs)
+                role = sys.intern(role)
+                source = sys.intern(source)
+                target = sys.intern(target)
+                reifs.setdefault(role, []).append((concept, source, target))
+                deifs.setdefault(concept, []).append((role, source, target))
+        self.reifications = reifs
+        self.dereifications = deifs
+
+        self._frozen = False
+        self._init_caches()
+
+    def _init_caches(self) -> None:
+        self._role_states: Dict[Role, Tuple[bool, bool]] = {}
+        self._inverted_roles: Dict[Role, Role] = {}
+        self._canonical_roles: Dict[Role, Role] = {}
+
+    def __getstate__(self):
+        state = {}
+        # subclasses may declare their own __slots__
+        for cls in type(self).__mro__:
+            slots = cls.__dict__.get('__slots__', ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            for name in slots:
+                # the caches are rebuilt instead of pickled
+                if (name in _CACHE_ATTRIBUTES
+                        or name in ('__dict__', '__weakref__')
+                        or not hasattr(self, name)):
+                    continue
+                state[name] = getattr(self, name)
+        # subclasses without __slots__ may have other attributes
+        state.update(getattr(self, '__dict__', {}))
+        # read-only mapping views cannot be pickled either
+        if self._frozen:
+            for name in _TABLE_ATTRIBUTES:
+                state[name] = dict(state[name])
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+        if self._frozen:
+            self._freeze_tables()
+        self._init_caches()
+
+    def freeze(self) -> 'Model':
+        """
+        Make the model's mappings read-only and return the model.
+
+        The :attr:`roles`, :attr:`normalizations`,
+        :attr:`reifications`, and :attr:`dereifications` mappings are
+        replaced with read-only views so a single model can be shared
+        (e.g., across threads) without defensive copies. The values
+        of the mappings are not copied or frozen.
+
+        Example:
+
+            >>> from penman.model import Model
+            >>> m = Model(roles={':ARG0': None}).freeze()
+            >>> m.roles[':ARG1'] = None
+            Traceback (most recent call last):
+              ...
+            TypeError: 'mappingproxy' object does not support item assignment
+        """
+        if not self._frozen:
+            self._frozen = True
+            self._freeze_tables()
+        return self
+
+    def _freeze_tables(self) -> None:
+        for name in _TABLE_ATTRIBUTES:
+            setattr(self, name, MappingProxyType(getattr(self, name)))
 
     def __eq__(self, other):
         if not isinstance(other, Model):
@@ -96,19 +211,38 @@ class Model(object):
         ``False`` is returned, even if something like
         :meth:`canonicalize_role` could return a valid role.
         """
-        return (self._has_role(role)
-                or (role.endswith('-of') and self._has_role(role[:-3])))
+        return self._role_state(role)[0]
 
     def _has_role(self, role: Role) -> bool:
-        return self._role_re.match(role) is not None
+        if role in self._role_set:
+            return True
+        return (self._role_re is not None
+                and self._role_re.match(role) is not None)
+
+    def _role_state(self, role: Role) -> Tuple[bool, bool]:
+        # return the results of has_role() and is_role_inverted() so
+        # both can share one cache
+        state = self._role_states.get(role)
+        if state is None:
+            known = self._has_role(role)
+            inverted = not known and role.endswith('-of')
+            defined = known or (inverted and self._has_role(role[:-3]))
+            state = self._role_states[role] = (defined, inverted)
+        return state
 
     def is_role_inverted(self, role: Role) -> bool:
         """Return ``True`` if *role* is inverted."""
-        return not self._has_role(role) and role.endswith('-of')
+        return self._role_state(role)[1]
 
     def invert_role(self, role: Role) -> Role:
         """Invert *role*."""
-        if not self._has_role(role) and role.endswith('-of'):
+        inverse = self._inverted_roles.get(role)
+        if inverse is None:
+            inverse = self._inverted_roles[role] = self._invert_role(role)
+        return inverse
+
+    def _invert_role(self, role: Role) -> Role:
+        if self._role_state(role)[1]:
             inverse = role[:-3]
         else:
             inverse = role + '-of'
@@ -159,22 +293,39 @@ class Model(object):
         * Replace the resulting role with a normalized form if one is
           defined in the model
         """
-        if role != '/' and not role.startswith(':'):
+        canonical = self._canonical_roles.get(role)
+        if canonical is None:
+            canonical = self._canonicalize_role(role)
+            self._canonical_roles[role] = canonical
+        return canonical
+
+    def _canonicalize_role(self, role: Role) -> Role:
+        if role[:1] != ':' and role != '/':
             role = ':' + role
         role = self._canonicalize_inversion(role)
         role = self.normalizations.get(role, role)
         return role
 
     def _canonicalize_inversion(self, role: Role) -> Role:
-        invert = self.invert_role
-        if not self._has_role(role):
-            while True:
-                prev = role
-                inverse = invert(role)
-                role = invert(inverse)
-                if prev == role:
-                    break
-        return role
+        has_role = self._has_role
+        if has_role(role):
+            return role
+        # strip -of suffixes until a known role is found, then restore
+        # one if an odd number was removed to keep the direction
+        base = role
+        n = 0
+        while base.endswith('-of'):
+            base = base[:-3]
+            n += 1
+            if has_role(base):
+                break
+        if n % 2 == 1:
+            return base + '-of'
+        elif n == 0 and has_role(role + '-of'):
+            # an unknown role may be the inverse of a known one
+            # (e.g., :consist for :consist-of)
+            return role + '-of-of'
+        return base
 
     def canonicalize(self, triple: BasicTriple) -> BasicTriple:
         """
@@ -188,6 +339,23 @@ class Model(object):
         canonical = self.canonicalize_role(role)
         return (source, canonical, target)
 
+    def canonicalize_many(
+            self,
+            triples: Iterable[BasicTriple]) -> List[BasicTriple]:
+        """
+        Canonicalize each triple in *triples*.
+
+        This is equivalent to calling :meth:`canonicalize` on each
+        triple, but it is faster for large batches of triples.
+        """
+        triples = list(triples)
+        # canonicalize each distinct role once, then map the triples
+        canonicalize_role = self.canonicalize_role
+        table = {role: canonicalize_role(role)
+                 for role in {triple[1] for triple in triples}}
+        return [(source, table[role], target)
+                for source, role, target in triples]
+
     def is_role_reifiable(self, role: Role) -> bool:
         """Return ``True`` if *role* can be reified."""
         return role in self.reifications
@@ -213,10 +381,35 @@ class Model(object):
         Returns:
             The 3-tuple of triples that reify *triple*.
         """
+        reification = self.try_reify(triple, variables)
+        if reification is None:
+            raise ModelError(f"'{triple[1]}' cannot be reified")
+        return reification
+
+    def try_reify(self,
+                  triple: BasicTriple,
+                  variables: Set[Variable] = None) -> Optional[_Reification]:
+        """
+        Return the three triples that reify *triple*, or ``None``.
+
+        This is the same as :meth:`reify` except that ``None`` is
+        returned instead of raising a
+        :exc:`~penman.exceptions.ModelError` when the role of *triple*
+        does not have a defined reification.
+
+        Args:
+            triple: the triple to reify
+            variables: a set of variables that should not be used for
+                the reified node's variable
+        Returns:
+            The 3-tuple of triples that reify *triple*, or ``None``.
+        """
         source, role, target = triple
-        if role not in self.reifications:
-            raise ModelError(f"'{role}' cannot be reified")
-        concept, source_role, target_role = next(iter(self.reifications[role]))
+        entries = self.reifications.get(role)
+        if not entries:
+            return None
+        # only the first reification of a role is used
+        concept, source_role, target_role = entries[0]
 
         var = '_'
         if variables:
@@ -2,28 +2,34 @@
 from penman import _lexer as lexer
 
 
-def test_lex_penman():
-    def _lex(s):
-        return [tok.type for tok in lexer.lex(s)]
+def _lex_penman(s):
+    return [tok.type for tok in lexer.lex(s, pattern=lexer.PENMAN_RE)]
+
+
+def _lex_triples(s):
+    return [tok.type for tok in lexer.lex(s, pattern=lexer.TRIPLE_RE)]
 
-    assert _lex('') == []
-    assert _lex('(a / alpha)') == [
+
+def test_lex_penman():
+    assert _lex_penman('') == []
+    assert _lex_penman('(a / alpha)') == [
         'LPAREN', 'SYMBOL', 'SLASH', 'SYMBOL', 'RPAREN']
-    assert _lex('(a/alpha\n  :ROLE b)') == [
+    assert _lex_penman('(a/alpha\n  :ROLE b)') == [
         'LPAREN', 'SYMBOL', 'SLASH', 'SYMBOL',
         'ROLE', 'SYMBOL', 'RPAREN']
-    assert _lex(['(a / alpha', '  :ROLE b)']) == _lex('(a/alpha\n  :ROLE b)')
-    assert _lex('(a :INT 1 :STR "hi there" :FLOAT -1.2e3)') == [
+    assert (_lex_penman(['(a / alpha', '  :ROLE b)'])
+            == _lex_penman('(a/alpha\n  :ROLE b)'))
+    assert _lex_penman('(a :INT 1 :STR "hi there" :FLOAT -1.2e3)') == [
         'LPAREN', 'SYMBOL',
         'ROLE', 'SYMBOL',
         'ROLE', 'STRING',
         'ROLE', 'SYMBOL',
         'RPAREN']
-    assert _lex('(a :ROLE~e.1,2 b~3)') == [
+    assert _lex_penman('(a :ROLE~e.1,2 b~3)') == [
         'LPAREN', 'SYMBOL',
         'ROLE', 'ALIGNMENT', 'SYMBOL', 'ALIGNMENT',
         'RPAREN']
-    assert _lex('# comment\n# (n / nope)\n(a / alpha)') == [
+    assert _lex_penman('# comment\n# (n / nope)\n(a / alpha)') == [
         'COMMENT', 'COMMENT', 'LPAREN', 'SYMBOL', 'SLASH', 'SYMBOL', 'RPAREN']
 
 
@@ -34,30 +40,27 @@ def test_lexing_issue_50():
 
 
 def test_lex_triples():
-    def _lex(s):
-        return [tok.type for tok in lexer.lex(s, pattern=lexer.TRIPLE_RE)]
-
-    assert _lex('') == []
+    assert _lex_triples('') == []
     # SYMBOL may contain commas, so sometimes they get grouped together
-    assert _lex('instance(a, alpha)') == [
+    assert _lex_triples('instance(a, alpha)') == [
         'SYMBOL', 'LPAREN', 'SYMBOL', 'SYMBOL', 'RPAREN']
-    assert _lex('instance(a , alpha)') == [
+    assert _lex_triples('instance(a , alpha)') == [
         'SYMBOL', 'LPAREN', 'SYMBOL', 'SYMBOL', 'SYMBOL', 'RPAREN']
-    assert _lex('instance(a ,alpha)') == [
+    assert _lex_triples('instance(a ,alpha)') == [
         'SYMBOL', 'LPAREN', 'SYMBOL', 'SYMBOL', 'RPAREN']
-    assert _lex('instance(a, alpha) ^ VAL(a, 1.0)') == [
+    assert _lex_triples('instance(a, alpha) ^ VAL(a, 1.0)') == [
         'SYMBOL', 'LPAREN', 'SYMBOL', 'SYMBOL', 'RPAREN',
         'SYMBOL',
         'SYMBOL', 'LPAREN', 'SYMBOL', 'SYMBOL', 'RPAREN']
-    assert _lex('instance(a, 1,000)') == [
+    assert _lex_triples('instance(a, 1,000)') == [
         'SYMBOL', 'LPAREN', 'SYMBOL', 'SYMBOL', 'RPAREN']
-    assert _lex('instance(a,1,000)') == [
+    assert _lex_triples('instance(a,1,000)') == [
         'SYMBOL', 'LPAREN', 'SYMBOL', 'RPAREN']
-    assert _lex('role(a,b) ^ role(b,c)') == [
+    assert _lex_triples('role(a,b) ^ role(b,c)') == [
         'SYMBOL', 'LPAREN', 'SYMBOL', 'RPAREN',
         'SYMBOL',
         'SYMBOL', 'LPAREN', 'SYMBOL', 'RPAREN']
-    assert _lex('role(a,b)^role(b,c)') == [
+    assert _lex_triples('role(a,b)^role(b,c)') == [
         'SYMBOL', 'LPAREN', 'SYMBOL', 'RPAREN',
         'SYMBOL', 'LPAREN', 'SYMBOL', 'RPAREN']
 
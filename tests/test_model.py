@@ -1,17 +1,43 @@
 
+import copy
+import pickle
+import weakref
+
 import pytest
 
 from penman.exceptions import ModelError
 from penman.model import Model
+from penman.models.noop import NoOpModel
 from penman.graph import Graph
 
 
+class SlottedModel(Model):
+    __slots__ = ('extra',)
+
+
 class TestModel:
     def test__init__(self, mini_amr):
         m = Model()
         assert len(m.roles) == 0
         m = Model(roles=mini_amr['roles'])
         assert len(m.roles) == 7
+        m = Model(roles=[(':ARG0', None)],
+                  normalizations=[(':ARG0-of', ':ARG1')])
+        assert m.roles == {':ARG0': None}
+        assert m.normalizations == {':ARG0-of': ':ARG1'}
+
+    def test__eq__(self, mini_amr):
+        assert Model() == Model()
+        assert Model() != Model(top_role=':top')
+        assert Model() != Model(roles=mini_amr['roles'])
+        assert Model.from_dict(mini_amr) == Model.from_dict(mini_amr)
+        assert Model() != 'model'
+        m = Model()
+        m.top_role = ':x'
+        assert m != Model()
+        m = Model()
+        m.normalizations = {':mod-of': ':domain'}
+        assert m != Model()
 
     def test_from_dict(self, mini_amr):
         assert Model.from_dict(mini_amr) == Model(
@@ -19,6 +45,54 @@ class TestModel:
             normalizations=mini_amr['normalizations'],
             reifications=mini_amr['reifications'])
 
+    def test_pickle(self, mini_amr):
+        m = Model.from_dict(mini_amr)
+        assert m.canonicalize_role(':mod-of') == ':domain'
+        m2 = pickle.loads(pickle.dumps(m))
+        assert m2 == m
+        assert m2.canonicalize_role(':mod-of') == ':domain'
+        assert m2.invert_role(':consist-of') == ':consist-of-of'
+        assert not hasattr(m2, '__dict__')
+        assert weakref.ref(m2)() is m2
+        m = NoOpModel(roles=mini_amr['roles'])
+        m.extra = 'data'
+        m2 = pickle.loads(pickle.dumps(m))
+        assert isinstance(m2, NoOpModel)
+        assert m2 == m
+        assert m2.extra == 'data'
+
+    def test_pickle_slotted_subclass(self, mini_amr):
+        m = SlottedModel(roles=mini_amr['roles'])
+        m.extra = 1
+        for m2 in (pickle.loads(pickle.dumps(m)),
+                   copy.copy(m),
+                   copy.deepcopy(m)):
+            assert m2 == m
+            assert m2.extra == 1
+            assert m2.has_role(':op1')
+        # unset slots are skipped
+        m2 = copy.deepcopy(SlottedModel())
+        assert not hasattr(m2, 'extra')
+
+    def test_freeze(self, mini_amr):
+        m = Model.from_dict(mini_amr)
+        assert m.freeze() is m
+        assert m.freeze() is m
+        assert m == Model.from_dict(mini_amr)
+        with pytest.raises(TypeError):
+            m.roles[':ARG2'] = {'type': 'frame'}
+        with pytest.raises(TypeError):
+            m.normalizations[':ARG0-of'] = ':ARG0'
+        with pytest.raises(TypeError):
+            m.reifications[':ARG0'] = []
+        with pytest.raises(TypeError):
+            m.dereifications['chase-01'] = []
+        assert m.canonicalize_role(':mod-of') == ':domain'
+        m2 = pickle.loads(pickle.dumps(m))
+        assert m2 == m
+        with pytest.raises(TypeError):
+            m2.roles[':ARG2'] = {'type': 'frame'}
+
     def test_has_role(self, mini_amr):
         m = Model()
         assert not m.has_role('')
@@ -132,6 +206,7 @@ class TestModel:
         assert m.canonicalize_role(':ARG0') == ':ARG0'
         assert m.canonicalize_role(':ARG0-of') == ':ARG0-of'
         assert m.canonicalize_role(':ARG0-of-of') == ':ARG0'
+        assert m.canonicalize_role(':ARG0-of-of-of') == ':ARG0-of'
         assert m.canonicalize_role(':consist') == ':consist'
         assert m.canonicalize_role(':consist-of') == ':consist-of'
         assert m.canonicalize_role(':consist-of-of') == ':consist'
@@ -151,6 +226,8 @@ class TestModel:
         assert m.canonicalize_role(':consist') == ':consist-of-of'
         assert m.canonicalize_role(':consist-of') == ':consist-of'
         assert m.canonicalize_role(':consist-of-of') == ':consist-of-of'
+        assert m.canonicalize_role(':consist-of-of-of') == ':consist-of'
+        assert m.canonicalize_role(':consist-of-of-of-of') == ':consist-of-of'
         assert m.canonicalize_role(':mod') == ':mod'
         assert m.canonicalize_role(':mod-of') == ':domain'
         assert m.canonicalize_role(':domain') == ':domain'
@@ -193,6 +270,21 @@ class TestModel:
         assert m.canonicalize(('a', 'consist-of', 'b')) == ('a', ':consist-of', 'b')
         assert m.canonicalize(('a', 'consist-of-of', 'b')) == ('a', ':consist-of-of', 'b')
 
+    def test_canonicalize_many(self, mini_amr):
+        m = Model.from_dict(mini_amr)
+        triples = [('a', ':ARG0-of-of', 'b'),
+                   ('a', 'consist', 'b'),
+                   ('a', ':mod-of', 'b'),
+                   ('a', ':op1', 'b')]
+        assert m.canonicalize_many([]) == []
+        assert m.canonicalize_many(triples) == [
+            m.canonicalize(triple) for triple in triples]
+        assert m.canonicalize_many(iter(triples)) == [
+            ('a', ':ARG0', 'b'),
+            ('a', ':consist-of-of', 'b'),
+            ('a', ':domain', 'b'),
+            ('a', ':op1', 'b')]
+
     def test_is_role_reifiable(self, mini_amr):
         m = Model()
         assert not m.is_role_reifiable(':ARG0')
@@ -234,6 +326,31 @@ class TestModel:
             ('_2', ':instance', 'have-mod-91'),
             ('_2', ':ARG2', 'b'))
 
+    def test_reify_modified_reifications(self, mini_amr):
+        m = Model.from_dict(mini_amr)
+        m.reifications[':x'] = [('c', ':s', ':t')]
+        assert m.is_role_reifiable(':x')
+        assert m.reify(('a', ':x', 'b')) == (
+            ('_', ':s', 'a'),
+            ('_', ':instance', 'c'),
+            ('_', ':t', 'b'))
+
+    def test_try_reify(self, mini_amr):
+        m = Model()
+        assert m.try_reify(('a', ':ARG0', 'b')) is None
+        assert m.try_reify(('a', ':mod', 'b')) is None
+        m = Model.from_dict(mini_amr)
+        assert m.try_reify(('a', ':ARG0', 'b')) is None
+        assert m.try_reify(('a', ':domain', 'b')) is None
+        assert m.try_reify(('a', ':mod', 'b')) == (
+            ('_', ':ARG1', 'a'),
+            ('_', ':instance', 'have-mod-91'),
+            ('_', ':ARG2', 'b'))
+        assert m.try_reify(('a', ':mod', 'b'), variables={'_'}) == (
+            ('_2', ':ARG1', 'a'),
+            ('_2', ':instance', 'have-mod-91'),
+            ('_2', ':ARG2', 'b'))
+
     def test_is_concept_dereifiable(self, mini_amr):
         m = Model()
         assert not m.is_concept_dereifiable('chase-01')